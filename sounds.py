@@ -4,135 +4,309 @@
 (requires pygame)
 """
 
-import os
+import heapq
+import io
+import itertools
 import random
 import logging
+from functools import partial
+from pathlib import Path
+from collections import defaultdict, deque
+from typing import Callable
 import pygame
 from pygame.mixer import Sound
 
 
 logger = logging.getLogger(__name__)
 
+# How each printed character sounds
+SPACES = 0
+CR = 1
+BELL = 2
+CHARS = 3
+# The background hum (a fade target, never a character class)
+HUM = 4
+
+# Final (hum, print-spaces, print-chars) volumes for each sound class and HUM
+_TARGETS = (
+    (0.0, 1.0, 0.0),  # SPACES
+    (0.0, 1.0, 0.0),  # CR
+    (0.0, 0.0, 0.0),  # BELL (mute the hum/print while it rings)
+    (0.0, 0.0, 1.0),  # CHARS
+    (1.0, 0.0, 0.0),  # HUM
+)
+
+# Volume of the fading-in loop at each step of a fade
+FADE_LEVELS = (0.3, 0.5, 0.7)
+# Whether the mixer has been set up yet
+_MIXER_INITED = False
+
+
+def _ensure_mixer_inited(buffer: int) -> None:
+    """Set the mixer parameters, once (must be before pygame.init)."""
+    global _MIXER_INITED  # pylint: disable=global-statement
+    if _MIXER_INITED:
+        return
+    pygame.mixer.pre_init(frequency=48000, size=-16, channels=2, buffer=buffer)
+    _MIXER_INITED = True
+
+
+# The sounds we play, which must be in the library for both lid states
+SOUND_NAMES = (
+    "hum",
+    "print-spaces",
+    "print-chars",
+    "key",
+    "lid",
+    "cr",
+    "bell",
+    "motor-on",
+    "motor-off",
+    "platen",
+)
+# Most characters we keep queued to print; older ones get dropped
+MAX_PENDING = 4096
+# Smallest volume change worth sending to the mixer (it uses 0-128)
+VOLUME_EPSILON = 1 / 128
+
+
+def _classify(code: int) -> int:
+    """Return the sound class for a character code."""
+    if code == 13:
+        return CR
+    if code == 7:
+        return BELL
+    if code <= 32 or chr(code).isspace():
+        return SPACES
+    return CHARS
+
+
+# Sound class of each ASCII and Latin-1 character
+_CHAR_CLASS = bytes(_classify(c) for c in range(256))
+
 
 class PygameSounds:
     """Teletype sounds, using pygame mixer."""
 
-    # Some events
+    # Some events (only EVENT_TICK comes from pygame; it runs our own timers
+    # for the rest)
     EVENT_HUM = pygame.USEREVENT + 2
     EVENT_KEY = pygame.USEREVENT + 3
     EVENT_CHR = pygame.USEREVENT + 4
     EVENT_SYNC = pygame.USEREVENT + 5
-    EVENTS = [EVENT_HUM, EVENT_KEY, EVENT_CHR, EVENT_SYNC]
+    EVENT_FADE = pygame.USEREVENT + 6
+    EVENT_TICK = pygame.USEREVENT + 7
+    EVENTS = [EVENT_TICK]
+    # Milliseconds between ticks while any timer is pending
+    TICK = 10
+
+    # Mixer buffer size in samples.  Smaller is less latency between a key
+    # and its sound (256 is about 5ms at 48kHz), but more risk of dropouts
+    # on a busy machine; go back up to 512 or 1024 if it crackles.
+    BUFFER = 256
 
     def __init__(self):
         """Create the class."""
-        pygame.mixer.pre_init(frequency=48000, size=-16, channels=2, buffer=512)
+        _ensure_mixer_inited(self.BUFFER)
         # Load the sounds into a dict for easy access
         self.sounds: dict[str, pygame.mixer.Sound] = {}
+        # Lookup tables built from the library: (lid, name) -> sound for
+        # single sounds, (lid, name) -> variants for 'repeated sample' sounds
+        self._direct: dict[tuple[str, str], pygame.mixer.Sound] = {}
+        self._groups: dict[tuple[str, str], tuple[pygame.mixer.Sound, ...]] = {}
         # Start with the lid up (close the lid with F7 if you want peace and quiet)
         self.lid_state = "up"
-        # Channels for playback
-        self.ch0: None | pygame.mixer.Channel = None
-        self.ch1: None | pygame.mixer.Channel = None
-        self.ch2: None | pygame.mixer.Channel = None
-        # Channels for effects
-        self._chfx: list[None | pygame.mixer.Channel] = [None, None, None]
-        # The current channel for effects
-        self._fx: int = 0
-        # Sounds that we keep using
-        self.hum_sound: None | pygame.mixer.Sound = None
-        self.spaces_sound: None | pygame.mixer.Sound = None
-        self.chars_sound: None | pygame.mixer.Sound = None
+        # Whether start() succeeded; nothing else works until it has
+        self._started = False
+        # Channels for playback (set by start())
+        self.ch0: pygame.mixer.Channel
+        self.ch1: pygame.mixer.Channel
+        self.ch2: pygame.mixer.Channel
+        # Channels for effects, least recently used first
+        self._chfx: deque[pygame.mixer.Channel] = deque()
+        # Sounds that we keep using (set by start())
+        self.hum_sound: pygame.mixer.Sound
+        self.spaces_sound: pygame.mixer.Sound
+        self.chars_sound: pygame.mixer.Sound
+        # Choices for (hum, print-spaces, print-chars) with the lid up/down
+        self._loops_up: tuple[tuple[pygame.mixer.Sound, ...], ...] = ()
+        self._loops_down: tuple[tuple[pygame.mixer.Sound, ...], ...] = ()
+        # Last volumes we gave those sounds (saves asking the mixer)
+        self._vol_hum: float = 0.0
+        self._vol_spaces: float = 0.0
+        self._vol_chars: float = 0.0
         # How many keypresses are queued (including current)
         self.active_key_count: int = 0
         # What characters are queued to print (including current)
-        self.active_printout: str = ""
+        self.active_printout: deque[str] = deque(maxlen=MAX_PENDING)
+        # Whether we've dropped characters since the queue was last empty
+        self._overflowed = False
+        # What to do for each sound class
+        self._handlers = (
+            partial(self._begin_fade, SPACES),
+            self._print_cr,
+            self._print_bell,
+            partial(self._begin_fade, CHARS),
+        )
+        # Fade in progress: (target loop, next step), or None
+        self._fade: None | tuple[int, int] = None
+        # Power state: "idle", "starting", "running", "stopping", "stopped"
+        self._phase = "idle"
+        # Pending timers: (due, seq, event, interval, loops) on a heap, and
+        # the live one for each event (any others on the heap are cancelled)
+        self._sched: list[tuple[int, int, int, int, int]] = []
+        self._timers: dict[int, tuple[int, int, int, int, int]] = {}
+        self._seq = itertools.count()
+        self._ticking = False
+        # Handlers for our events
+        self._dispatch: dict[int, Callable[[], None]] = {
+            self.EVENT_HUM: self._on_hum,
+            self.EVENT_KEY: self._on_key,
+            self.EVENT_CHR: self._on_chr,
+            self.EVENT_FADE: self._on_fade,
+            self.EVENT_SYNC: self._on_sync,
+        }
 
     def get(self, sound_name: str) -> pygame.mixer.Sound:
         """Get a sound by name.
 
         All sounds depend on whether the lid is open, that's part of the name.
         """
-        actual_name = self.lid_state + "-" + sound_name
-        if sound_name in self.sounds:
-            return self.sounds[actual_name]
-        # There are some 'repeated sample' sounds (e.g. keys) where we choose one at random from the set
-        sounds = [
-            sound for name, sound in self.sounds.items() if name.startswith(actual_name)
+        key = (self.lid_state, sound_name)
+        try:
+            return self._direct[key]
+        except KeyError:
+            # There are some 'repeated sample' sounds (e.g. keys) where we choose one at random from the set
+            return random.choice(self._groups[key])
+
+    def _index_sounds(self) -> None:
+        """Build the lookup tables used by get().
+
+        Filenames are "lid-name" or "lid-name-NN", where NN numbers the
+        variants of a 'repeated sample' sound.
+        """
+        groups: defaultdict[tuple[str, str], list[pygame.mixer.Sound]] = defaultdict(
+            list
+        )
+        for filename, sound in self.sounds.items():
+            lid, _, name = filename.partition("-")
+            base, _, variant = name.rpartition("-")
+            if base and variant.isdigit():
+                groups[(lid, base)].append(sound)
+            else:
+                self._direct[(lid, name)] = sound
+        self._groups = {key: tuple(sounds) for key, sounds in groups.items()}
+
+    def _variants(self, lid: str, sound_name: str) -> tuple[pygame.mixer.Sound, ...]:
+        """Return all the sounds get() might pick for a name and lid state."""
+        try:
+            return (self._direct[(lid, sound_name)],)
+        except KeyError:
+            return self._groups[(lid, sound_name)]
+
+    def _missing_sounds(self) -> list[str]:
+        """Return the full names of any sounds get() would not find."""
+        return [
+            lid + "-" + name
+            for lid in ("up", "down")
+            for name in SOUND_NAMES
+            if (lid, name) not in self._direct and (lid, name) not in self._groups
         ]
-        return random.sample(sounds, 1)[0]
 
     def start(self) -> None:
         """Load the sound library."""
         try:
-            with os.scandir(
-                path=os.path.join(os.path.dirname(__file__), "sounds")
-            ) as scan:
-                for entry in scan:
-                    if entry.is_file():
-                        filename, ext = os.path.splitext(entry.name)
-                        if ext == ".wav":
-                            self.sounds[filename] = Sound(entry.path)
-        except pygame.error:
+            # Read each file whole, so SDL decodes from memory
+            raw: dict[str, bytes] = {}
+            for path in (Path(__file__).parent / "sounds").glob("*.wav"):
+                if path.is_file():
+                    raw[path.stem] = path.read_bytes()
+            for filename, data in raw.items():
+                # Sound(buffer=...) would take this as raw samples, not a .wav
+                self.sounds[filename] = Sound(io.BytesIO(data))
+        except (OSError, pygame.error):
             logging.exception("Could not initialize sounds.")
             return
         if not self.sounds:
             logging.error("Could not load sounds.")
             return
+        self._index_sounds()
+        missing = self._missing_sounds()
+        if missing:
+            logging.error("Missing sounds: %s", ", ".join(missing))
+            self.sounds.clear()
+            return
 
         pygame.mixer.set_reserved(6)
         self.ch0 = pygame.mixer.Channel(0)  # used for on/off, background hum, lid
         self.ch1 = pygame.mixer.Channel(1)  # printing spaces (loop)
-        self.ch2 = pygame.mixer.Channel(3)  # printing characters (loop)
-        self._chfx = [  # fx: input (keypresses), platen, bells, etc
-            pygame.mixer.Channel(3),
-            pygame.mixer.Channel(4),
-            pygame.mixer.Channel(5),
-        ]
-
+        self.ch2 = pygame.mixer.Channel(2)  # printing characters (loop)
+        self._chfx = deque(  # fx: input (keypresses), platen, bells, etc
+            [
+                pygame.mixer.Channel(3),
+                pygame.mixer.Channel(4),
+                pygame.mixer.Channel(5),
+            ]
+        )
+
+        self._loops_up, self._loops_down = (
+            tuple(
+                self._variants(lid, name)
+                for name in ("hum", "print-spaces", "print-chars")
+            )
+            for lid in ("up", "down")
+        )
         self.hum_sound = self.get("hum")
         self.spaces_sound = self.get("print-spaces")
         self.chars_sound = self.get("print-chars")
 
-        # Play the power-on sound, then to background after 1.5
+        # Play the power-on sound, then the loops take over (at EVENT_SYNC)
+        self._phase = "starting"
         self.ch0.play(self.get("motor-on"))
-        pygame.time.set_timer(self.EVENT_SYNC, 1500)
-        pygame.time.wait(1000)
-        self._start_paused()
+        self._set_timer(self.EVENT_SYNC, 1000, loops=1)
+        self._started = True
 
     @property
     def chfx(self) -> pygame.mixer.Channel:
-        """Get a channel for effects."""
-        for i in range(len(self._chfx)):
-            channel = self._chfx[i]
-            assert channel is not None
-            if not channel.get_busy():
-                self._fx = i
-                return channel
-        self._fx = (self._fx + 1) % len(self._chfx)
-        grabbed = self._chfx[self._fx]
-        assert grabbed is not None
-        return grabbed
+        """Get a channel for effects.
+
+        Takes the least recently used channel, or if that one is still
+        playing, cuts off the next one.
+        """
+        channel = self._chfx[0]
+        self._chfx.rotate(-1)
+        if channel.get_busy():
+            channel = self._chfx[0]
+            self._chfx.rotate(-1)
+        return channel
 
     def stop(self):
-        """Wrap-up the sounds system."""
-        if not self.sounds:
+        """Wrap-up the sounds system.
+
+        Returns immediately; keep passing events in until stopping is False.
+        """
+        if not self._started:
             return
-        assert self.ch0 is not None
-        # Play the power-off sound
+        self._phase = "stopping"
+        for evt in (self.EVENT_HUM, self.EVENT_KEY, self.EVENT_CHR):
+            self._set_timer(evt, 0)
+        self._cancel_fade()
+        # Play the power-off sound, fading out as it goes
         self.ch0.play(self.get("motor-off"))
-        # Wait until it plays out a bit
-        pygame.time.wait(500)
-        # Fade out over 1 second
-        self.ch0.fadeout(1000)
-        pygame.time.wait(1000)
+        self.ch0.fadeout(1500)
+        self._set_timer(self.EVENT_SYNC, 1500, loops=1)
+
+    @property
+    def stopping(self) -> bool:
+        """Return whether the power-off sound is still playing."""
+        return self._phase == "stopping"
 
     def lid(self):
         """Open or close the lid."""
-        if not self.sounds:
+        if not self._started:
             return
         logger.debug("lid")
-        self._fade_to_hum()
+        self._begin_fade(HUM)
         self.chfx.play(self.get("lid"))
         # Flip the lid state
         if self.lid_state == "down":
@@ -140,38 +314,41 @@ class PygameSounds:
         else:
             self.lid_state = "down"
         # The main sounds will change with the new lid position
-        pygame.time.set_timer(self.EVENT_SYNC, 250)
+        self._set_timer(self.EVENT_SYNC, 250)
 
     def platen(self):
         """Hand-scrolled platen for page up & down."""
-        if not self.sounds:
+        if not self._started:
             return
         logger.debug("platen")
         self.chfx.play(self.get("platen"))
 
     def _start_loops(self):
         """Start all looping sounds."""
-        assert self.ch0 is not None and self.ch1 is not None and self.ch2 is not None
-        self.hum_sound = self.get("hum")
-        self.spaces_sound = self.get("print-spaces")
-        self.chars_sound = self.get("print-chars")
+        self._cancel_fade()
+        hums, spaces, chars = (
+            self._loops_up if self.lid_state == "up" else self._loops_down
+        )
+        self.hum_sound = random.choice(hums)
+        self.spaces_sound = random.choice(spaces)
+        self.chars_sound = random.choice(chars)
         self.ch0.play(self.hum_sound, loops=-1)
         self.ch1.play(self.spaces_sound, loops=-1)
         self.ch2.play(self.chars_sound, loops=-1)
         self.hum_sound.set_volume(0.0)
         self.spaces_sound.set_volume(0.0)
         self.chars_sound.set_volume(0.0)
+        self._vol_hum = self._vol_spaces = self._vol_chars = 0.0
 
     def _start_paused(self):
         """Start all looping sounds, pausing them."""
         self._start_loops()
-        assert self.ch1 is not None and self.ch2 is not None
         self.ch1.pause()
         self.ch2.pause()
 
     def keypress(self, key: str) -> None:
         """Register a key pressed at the keyboard (may or may not echo)."""
-        if not self.sounds:
+        if not self._started:
             return
         logger.debug("keypress")
         self.active_key_count = self.active_key_count + 1
@@ -179,164 +356,231 @@ class PygameSounds:
             # Just queue it and keep going
             return
         # In a while we can press another key
-        pygame.time.set_timer(self.EVENT_KEY, 100)
+        self._set_timer(self.EVENT_KEY, 100)
         self._sound_for_keypress()
 
     def _sound_for_keypress(self) -> None:
         """Play a keypress sound."""
         if self.active_key_count <= 0:
             # No next keypress.  Cancel the timer.
-            pygame.time.set_timer(self.EVENT_KEY, 0)
+            self._set_timer(self.EVENT_KEY, 0)
         else:
             # Press any key (they all sound similar)
             self.chfx.play(self.get("key"))
 
     def print_chars(self, chars: str) -> None:
         """Print a series of characters."""
-        if not self.sounds:
+        if not self._started:
             return
         logger.debug("print: %s", chars)
-        # Add to the string that we're printing
-        self.active_printout = self.active_printout + chars
+        # Add to the queue that we're printing (dropping the oldest if full)
+        if len(self.active_printout) + len(chars) > MAX_PENDING:
+            if not self._overflowed:
+                logger.info("Print queue full, dropping sounds")
+                self._overflowed = True
+        self.active_printout.extend(chars)
         # Set the print timer for 100ms (repeats)
-        pygame.time.set_timer(self.EVENT_CHR, 100)
+        self._set_timer(self.EVENT_CHR, 100)
         self._sound_for_char()
 
     def _sound_for_char(self):
         """Play a sound for the next printed character."""
-        next_char = self.active_printout[:1]
-        assert self.hum_sound is not None
-        assert self.spaces_sound is not None
-        assert self.chars_sound is not None
+        next_char = self.active_printout[0] if self.active_printout else ""
         if next_char == "":
             # No next character.  Go back to hum.
-            pygame.time.set_timer(self.EVENT_CHR, 0)
-            pygame.time.set_timer(self.EVENT_HUM, 100)
-        elif next_char == "\r":
-            # Carriage return (not newline, that just sounds as a space)
-            self.hum_sound.set_volume(0.0)
-            self.spaces_sound.set_volume(1.0)
-            self.chars_sound.set_volume(0.0)
-            self.chfx.play(self.get("cr"))
-            # Reset the loop timing
-            pygame.time.set_timer(self.EVENT_SYNC, 10)
-        elif next_char == "\007":
-            # Mute the hum/print while we do this
-            self.hum_sound.set_volume(0.0)
-            self.spaces_sound.set_volume(0.0)
-            self.chars_sound.set_volume(0.0)
-            self.chfx.play(self.get("bell"))
-        elif ord(next_char) <= 32 or next_char.isspace():
-            # Control characters and spaces
-            self._fade_to_spaces()
-        else:
-            # Treat anything else as printable
-            self._fade_to_chars()
-
-    def _fade_to_hum(self):
-        assert self.hum_sound is not None
-        assert self.spaces_sound is not None
-        assert self.chars_sound is not None
-        if self.hum_sound.get_volume() <= 0.99:
-            self.hum_sound.set_volume(0.3)
-            self.spaces_sound.set_volume(self.spaces_sound.get_volume() * 0.7)
-            self.chars_sound.set_volume(self.chars_sound.get_volume() * 0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(0.5)
-            self.spaces_sound.set_volume(self.spaces_sound.get_volume() * 0.7)
-            self.chars_sound.set_volume(self.chars_sound.get_volume() * 0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(0.7)
-            self.spaces_sound.set_volume(self.spaces_sound.get_volume() * 0.7)
-            self.chars_sound.set_volume(self.chars_sound.get_volume() * 0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(1.0)
-            self.spaces_sound.set_volume(0.0)
-            self.chars_sound.set_volume(0.0)
-        assert self.ch1 is not None
-        assert self.ch2 is not None
-        self.ch1.pause()
-        self.ch2.pause()
-
-    def _fade_to_spaces(self):
-        assert self.hum_sound is not None
-        assert self.spaces_sound is not None
-        assert self.chars_sound is not None
-        if self.spaces_sound.get_volume() <= 0.99:
-            self.hum_sound.set_volume(self.hum_sound.get_volume() * 0.7)
-            self.spaces_sound.set_volume(0.3)
-            self.chars_sound.set_volume(self.chars_sound.get_volume() * 0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(self.hum_sound.get_volume() * 0.7)
-            self.spaces_sound.set_volume(0.5)
-            self.chars_sound.set_volume(self.chars_sound.get_volume() * 0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(self.hum_sound.get_volume() * 0.7)
-            self.spaces_sound.set_volume(0.7)
-            self.chars_sound.set_volume(self.chars_sound.get_volume() * 0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(0.0)
-            self.spaces_sound.set_volume(1.0)
-            self.chars_sound.set_volume(0.0)
-        assert self.ch1 is not None
-        assert self.ch2 is not None
-        self.ch1.unpause()
-        self.ch2.unpause()
-
-    def _fade_to_chars(self):
-        assert self.hum_sound is not None
-        assert self.spaces_sound is not None
-        assert self.chars_sound is not None
-        if self.chars_sound.get_volume() <= 0.99:
-            self.hum_sound.set_volume(self.hum_sound.get_volume() * 0.7)
-            self.spaces_sound.set_volume(self.spaces_sound.get_volume() * 0.7)
-            self.chars_sound.set_volume(0.3)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(self.hum_sound.get_volume() * 0.7)
-            self.spaces_sound.set_volume(self.spaces_sound.get_volume() * 0.7)
-            self.chars_sound.set_volume(0.5)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(self.hum_sound.get_volume() * 0.7)
-            self.spaces_sound.set_volume(self.spaces_sound.get_volume() * 0.7)
-            self.chars_sound.set_volume(0.7)
-            pygame.time.wait(3)
-            self.hum_sound.set_volume(0.0)
-            self.spaces_sound.set_volume(0.0)
-            self.chars_sound.set_volume(1.0)
-        assert self.ch1 is not None
-        assert self.ch2 is not None
-        self.ch1.unpause()
-        self.ch2.unpause()
+            self._overflowed = False
+            self._set_timer(self.EVENT_CHR, 0)
+            self._set_timer(self.EVENT_HUM, 100)
+            return
+        self._handlers[self._char_class(next_char)]()
+
+    def _char_class(self, char: str) -> int:
+        """Return how a character sounds when printed."""
+        code = ord(char)
+        # Treat anything past Latin-1 as printable
+        return _CHAR_CLASS[code] if code < 256 else CHARS
+
+    def _print_cr(self):
+        """Carriage return (not newline, that just sounds as a space)."""
+        self._cancel_fade()
+        self._set_volumes(*_TARGETS[CR])
+        self.chfx.play(self.get("cr"))
+        # Reset the loop timing
+        self._set_timer(self.EVENT_SYNC, 10)
+
+    def _print_bell(self):
+        """Ring the bell."""
+        self._cancel_fade()
+        self._set_volumes(*_TARGETS[BELL])
+        self.chfx.play(self.get("bell"))
+
+    def _set_volumes(self, hum: float, spaces: float, chars: float) -> None:
+        """Set the volumes of the looping sounds, skipping any unchanged."""
+        if abs(hum - self._vol_hum) > VOLUME_EPSILON:
+            self.hum_sound.set_volume(hum)
+            self._vol_hum = hum
+        if abs(spaces - self._vol_spaces) > VOLUME_EPSILON:
+            self.spaces_sound.set_volume(spaces)
+            self._vol_spaces = spaces
+        if abs(chars - self._vol_chars) > VOLUME_EPSILON:
+            self.chars_sound.set_volume(chars)
+            self._vol_chars = chars
+
+    def _begin_fade(self, target: int) -> None:
+        """Start fading one loop in and the others out.
+
+        The fade is stepped by EVENT_FADE, so this returns immediately.
+        """
+        if self._fade is not None and self._fade[0] == target:
+            # Already on the way there
+            return
+        if target != HUM:
+            self.ch1.unpause()
+            self.ch2.unpause()
+        volume = {
+            HUM: self._vol_hum,
+            SPACES: self._vol_spaces,
+            CHARS: self._vol_chars,
+        }[target]
+        if volume > 0.99:
+            self._cancel_fade()
+            if target == HUM:
+                self.ch1.pause()
+                self.ch2.pause()
+            return
+        self._fade_step(target, FADE_LEVELS[0])
+        self._fade = (target, 1)
+        self._set_timer(self.EVENT_FADE, 3, loops=len(FADE_LEVELS))
+
+    def _fade_step(self, target: int, level: float) -> None:
+        """Bring the target loop to level, and the others down a bit."""
+        hum, spaces, chars = _TARGETS[target]
+        self._set_volumes(
+            level if hum else self._vol_hum * 0.7,
+            level if spaces else self._vol_spaces * 0.7,
+            level if chars else self._vol_chars * 0.7,
+        )
+
+    def _end_fade(self, target: int) -> None:
+        """Finish a fade: only the target loop is left playing."""
+        self._fade = None
+        self._set_volumes(*_TARGETS[target])
+        if target == HUM:
+            self.ch1.pause()
+            self.ch2.pause()
+
+    def _cancel_fade(self) -> None:
+        """Stop any fade in progress, leaving the volumes where they are."""
+        if self._fade is not None:
+            self._fade = None
+            self._set_timer(self.EVENT_FADE, 0)
+
+    def _set_timer(self, evt: int, millis: int, loops: int = 0) -> None:
+        """Like pygame.time.set_timer, but for our own timers.
+
+        Replaces any pending timer for evt (millis 0 just cancels it);
+        loops 0 repeats until cancelled.
+        """
+        if millis <= 0:
+            self._timers.pop(evt, None)
+            return
+        entry = (pygame.time.get_ticks() + millis, next(self._seq), evt, millis, loops)
+        self._timers[evt] = entry
+        heapq.heappush(self._sched, entry)
+        if not self._ticking:
+            pygame.time.set_timer(self.EVENT_TICK, self.TICK)
+            self._ticking = True
 
     def event(self, evt: int) -> None:
         """Process a pygame event."""
-        if not self.sounds:
+        if not self._started:
             return
-        if evt == self.EVENT_HUM:
-            logger.debug("EVENT_HUM")
-            # Cancel the hum timer
-            pygame.time.set_timer(self.EVENT_HUM, 0)
-            # Background hum (unless there's print pending)
-            if self.active_printout:
-                # No hum yet, we're printing
-                return
-            # Go back to playing the hum on loop, and pause the spaces/chars loops
-            self._fade_to_hum()
-
-        elif evt == self.EVENT_KEY:
-            logger.debug("EVENT_KEY")
-            self.active_key_count = self.active_key_count - 1
-            self._sound_for_keypress()
-
-        elif evt == self.EVENT_CHR:
-            self.active_printout = self.active_printout[1:]
-            self._sound_for_char()
-
-        elif evt == self.EVENT_SYNC:
-            # Sync after startup and CR: reset the spaces/chars loops.
-            pygame.time.set_timer(self.EVENT_SYNC, 0)
-            pygame.time.set_timer(self.EVENT_HUM, 100)
-            self._start_loops()
+        if evt != self.EVENT_TICK:
+            logger.debug("Event: %s", evt)
+            return
+        now = pygame.time.get_ticks()
+        while self._sched and self._sched[0][0] <= now:
+            entry = heapq.heappop(self._sched)
+            _, _, timer_evt, interval, loops = entry
+            if self._timers.get(timer_evt) is not entry:
+                continue  # cancelled or replaced
+            if loops == 1:
+                del self._timers[timer_evt]
+            else:
+                # Timers don't catch up: at most one firing per tick
+                again = (
+                    now + interval,
+                    next(self._seq),
+                    timer_evt,
+                    interval,
+                    loops - 1 if loops else 0,
+                )
+                self._timers[timer_evt] = again
+                heapq.heappush(self._sched, again)
+            self._timer_event(timer_evt)
+        if not self._timers:
+            # Nothing pending: stop ticking until there is
+            self._sched.clear()
+            pygame.time.set_timer(self.EVENT_TICK, 0)
+            self._ticking = False
+
+    def _timer_event(self, evt: int) -> None:
+        """Process one of our timer events."""
+        if self._phase in ("stopping", "stopped"):
+            if evt == self.EVENT_SYNC:
+                # The power-off sound has played out
+                self._phase = "stopped"
+            return
+        self._dispatch[evt]()
+
+    def _on_hum(self) -> None:
+        """Handle EVENT_HUM: go back to the hum after printing stops."""
+        logger.debug("EVENT_HUM")
+        # Cancel the hum timer
+        self._set_timer(self.EVENT_HUM, 0)
+        # Background hum (unless there's print pending)
+        if self.active_printout:
+            # No hum yet, we're printing
+            return
+        # Go back to playing the hum on loop, and pause the spaces/chars loops
+        self._begin_fade(HUM)
+
+    def _on_key(self) -> None:
+        """Handle EVENT_KEY: the current keypress is done."""
+        logger.debug("EVENT_KEY")
+        self.active_key_count = self.active_key_count - 1
+        self._sound_for_keypress()
+
+    def _on_chr(self) -> None:
+        """Handle EVENT_CHR: the current character is printed.
+
+        Any following characters that sound the same go along with it, so
+        a long printout doesn't leave the sound lagging far behind.
+        """
+        printout = self.active_printout
+        if printout:
+            current = self._char_class(printout.popleft())
+            while printout and self._char_class(printout[0]) == current:
+                printout.popleft()
+        self._sound_for_char()
 
+    def _on_fade(self) -> None:
+        """Handle EVENT_FADE: the next step of a fade."""
+        if self._fade is None:
+            return
+        target, step = self._fade
+        if step < len(FADE_LEVELS):
+            self._fade_step(target, FADE_LEVELS[step])
+            self._fade = (target, step + 1)
         else:
-            logger.debug("Event: %s", evt)
+            self._end_fade(target)
+
+    def _on_sync(self) -> None:
+        """Handle EVENT_SYNC: after startup and CR, reset the spaces/chars loops."""
+        self._set_timer(self.EVENT_SYNC, 0)
+        self._set_timer(self.EVENT_HUM, 100)
+        if self._phase == "starting":
+            self._phase = "running"
+            self._start_paused()
+        else:
+            self._start_loops()
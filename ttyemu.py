@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 """ASR-33 terminal emulator."""
+from array import array
+from collections import defaultdict, deque
+import functools
 from io import BufferedIOBase
 import socket
 import sys
@@ -11,6 +14,7 @@ import abc
 import subprocess
 import logging
 import os
+import re
 import shlex
 import asyncio
 import telnetlib3
@@ -29,7 +33,7 @@ from telnetlib import (
     TSPEED,
     NAWS,
 )
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 try:
     from typing import Self  # type: ignore
@@ -62,6 +66,13 @@ logger = logging.getLogger(__name__)
 COLUMNS = 72
 TEXT_COLOR = (0x33, 0x33, 0x33)
 
+# Runs of characters that just print (everything else moves the carriage)
+_PRINTABLE_RUN = re.compile(r"[^\x00-\x1f]+")
+# Runs of characters string_test places without moving anywhere else
+_LINE_RUN = re.compile(r"[^\t\r\b\f\n]+")
+# Runs of visible characters (spaces are never stored)
+_INK_RUN = re.compile(r"[^ ]+")
+
 
 def upper(char: str) -> str:
     """Convert a character to uppercase in the dumbest way possible."""
@@ -72,6 +83,10 @@ def upper(char: str) -> str:
     return chr(ochar + 32)
 
 
+# upper() for all of ASCII, for use with str.translate
+_UPPER = str.maketrans({chr(code): upper(chr(code)) for code in range(128)})
+
+
 def background_color() -> tuple[int, int, int]:
     """Return a background color."""
     # Mainly for debug purposes, each new surface
@@ -88,22 +103,45 @@ class AbstractLine:
 
     def __init__(self) -> None:
         """No arguments."""
-        self.extents: list[tuple[int, str]] = []
+        # Extents as parallel columns: where each begins, and its text
+        self.begins: array[int] = array("i")
+        self.texts: list[bytearray] = []
+        # Which extent ends at each column, for joining on more text
+        self._by_end: dict[int, int] = {}
 
     def place_char(self, column: int, char: str) -> None:
         """Insert a character into an available extent."""
         if char == " ":
             return
-        for i, (begin, text) in enumerate(self.extents):
-            end = begin + len(text)
-            if end == column:
-                text = text + char
-                self.extents[i] = (begin, text)
-            elif end + 1 == column:
-                text = text + " " + char
-                self.extents[i] = (begin, text)
-            # extend left? replace spaces?
-        self.extents.append((column, char))
+        self._place_text(column, char)
+
+    def place_run(self, column: int, run: str) -> None:
+        """Insert a run of characters starting at column.
+
+        Each stretch between spaces goes in as a single extent, or joins an
+        extent that ends where it starts.
+        """
+        for match in _INK_RUN.finditer(run):
+            self._place_text(column + match.start(), match.group())
+
+    def _place_text(self, column: int, text: str) -> None:
+        """Insert text with no spaces into an available extent."""
+        data = text.encode("ascii", "replace")
+        idx = self._by_end.pop(column, None)
+        if idx is None:
+            # Nothing to join up with
+            self._by_end[column + len(data)] = len(self.texts)
+            self.begins.append(column)
+            self.texts.append(bytearray(data))
+            return
+        extent = self.texts[idx]
+        extent.extend(data)
+        self._by_end[self.begins[idx] + len(extent)] = idx
+
+    def iter_extents(self) -> Iterator[tuple[int, str]]:
+        """Yield (begin, text) for each extent."""
+        for begin, text in zip(self.begins, self.texts):
+            yield begin, text.decode("ascii")
 
     def string_test(self, chars: str, column: int = 0):
         """Test a given string.
@@ -111,20 +149,27 @@ class AbstractLine:
         Insert a sequence of character, interpreting backspace, tab, and
         carriage return. Return value is final column.
         """
-        for char in chars:
+        pos = 0
+        while pos < len(chars):
+            match = _LINE_RUN.match(chars, pos)
+            if match:
+                run = match.group()
+                pos = match.end()
+                # Anything past the right margin piles up in the last column
+                fits = run[: COLUMNS - column]
+                self.place_run(column, fits)
+                for char in run[len(fits) :]:
+                    self.place_char(COLUMNS - 1, char)
+                column = min(COLUMNS - 1, column + len(run))
+                continue
+            char = chars[pos]
+            pos += 1
             if char == "\t":
-                column = (column + 8) & -8
+                column = min(COLUMNS - 1, (column + 8) & -8)
             elif char == "\r":
                 column = 0
             elif char == "\b":
-                column -= 1
-            else:
-                self.place_char(column, char)
-                column += 1
-            if column > 71:
-                column = 71
-            if column < 0:
-                column = 0
+                column = max(0, column - 1)
         return column
 
     @staticmethod
@@ -133,7 +178,7 @@ class AbstractLine:
         print("Test of", repr(chars))
         line = AbstractLine()
         line.string_test(chars)
-        for begin, text in line.extents:
+        for begin, text in line.iter_extents():
             print("    ", begin, repr(text))
 
 
@@ -158,6 +203,11 @@ class Frontend(abc.ABC):
         """Draw a character from terminal output."""
         raise NotImplementedError
 
+    def draw_run(self, line: int, column: int, run: str) -> None:
+        """Draw a run of characters from terminal output, left to right."""
+        for offset, char in enumerate(run):
+            self.draw_char(line, column + offset, char)
+
     @abc.abstractmethod
     def lines_screen(self) -> int:
         """Return the number of lines per screen."""
@@ -179,6 +229,9 @@ class Frontend(abc.ABC):
 class Backend(abc.ABC):
     """The backend -- the connection we're using."""
 
+    # Cleared by the frontend once it stops taking characters
+    alive: bool = True
+
     @abc.abstractmethod
     def __init__(self, postchars: Callable[[str], None] = lambda chars: None) -> None:
         """postchars: function to place characters in the output queue."""
@@ -196,6 +249,105 @@ class Backend(abc.ABC):
         raise NotImplementedError
 
 
+class Pacer:
+    """Feeds a backend's output to the frontend at teletype speed.
+
+    The network thread hands over whatever it has read, and the pacer
+    posts it one character every 0.105 seconds, or all at once in fast
+    mode, from its own thread. The queue is bounded: put() blocks while
+    it is full, so a fast host is held back by flow control instead of
+    filling memory.
+    """
+
+    CHAR_TIME = 0.105
+    # Most characters queued before put() blocks.  Slow mode keeps only a
+    # few, so an interrupt isn't stuck behind minutes of queued output.
+    SLOW_HIGH_WATER = 16
+    FAST_HIGH_WATER = 4096
+
+    def __init__(self, backend: Backend):
+        """backend: the backend whose postchars and fast_mode are used."""
+        self.backend = backend
+        self._paced_q: deque[str] = deque()
+        self._wake = threading.Event()
+        # Signalled as the queue drains, for put() and room()
+        self._drained = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self.thread_target, daemon=True)
+
+    def start(self) -> None:
+        """Start the pacing thread."""
+        self._thread.start()
+
+    def _high_water(self) -> int:
+        """Return how many characters may be queued in the current mode."""
+        if self.backend.fast_mode:
+            return self.FAST_HIGH_WATER
+        return self.SLOW_HIGH_WATER
+
+    def room(self) -> int:
+        """Wait until there's room in the queue, and return how much."""
+        with self._drained:
+            while self.backend.alive:
+                room = self._high_water() - len(self._paced_q)
+                if room > 0:
+                    return room
+                self._drained.wait()
+        return 1
+
+    def put(self, text: str) -> None:
+        """Queue characters for output, waiting while the queue is full.
+
+        Text is dropped once the frontend has shut down.
+        """
+        self.room()
+        if self.backend.alive:
+            self._paced_q.extend(text)
+            self._wake.set()
+
+    def close(self) -> None:
+        """Wait until everything queued has been posted, then stop."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+
+    def thread_target(self) -> None:
+        """Post queued characters until closed."""
+        backend = self.backend
+        postchars = backend.postchars
+        queue = self._paced_q
+        popleft = queue.popleft
+        wake = self._wake
+        drained = self._drained
+        # When the next character is due in slow mode, so the time taken to
+        # post each one doesn't slow the pace down
+        due = time.monotonic()
+        while True:
+            wake.clear()
+            if not backend.alive:
+                with drained:
+                    drained.notify_all()
+                return
+            if not queue:
+                if self._closed:
+                    return
+                wake.wait()
+                continue
+            if backend.fast_mode:
+                with drained:
+                    text = "".join([popleft() for _ in range(len(queue))])
+                    drained.notify_all()
+            else:
+                now = time.monotonic()
+                if due > now:
+                    time.sleep(due - now)
+                with drained:
+                    text = popleft()
+                    drained.notify_all()
+                due = max(now, due) + self.CHAR_TIME
+            postchars(text)
+
+
 class Terminal:
     """Class for keeping track of the terminal state."""
 
@@ -217,7 +369,18 @@ class Terminal:
         self.max_line: int = 0
         self.frontend: Frontend = frontend
         self.backend: Backend = backend
-        self.lines: dict[int, AbstractLine] = {}
+        self.lines: defaultdict[int, AbstractLine] = defaultdict(AbstractLine)
+        # The frontend's lines_screen(), refreshed by resize()
+        self._lines_screen: int = frontend.lines_screen()
+        # Characters that move the carriage or paper; the other control
+        # characters do nothing. Each keeps the cursor in bounds itself.
+        self.controls: dict[str, Callable[[], None]] = {
+            "\n": self.newline,
+            "\r": self.carriage_return,
+            "\t": self.tab,
+            "\b": self.backspace,
+            "\f": self.reinit,
+        }
 
     def reinit(self):
         """Discard all state."""
@@ -228,53 +391,94 @@ class Terminal:
         self.max_line = 0
         self.lines.clear()
 
-    def alloc_line(self, line: int):
+    def alloc_line(self, line: int) -> AbstractLine:
         """Return a line, creating a new one if it doesn't exist."""
-        try:
-            return self.lines[line]
-        except KeyError:
-            return self.lines.setdefault(line, AbstractLine())
+        return self.lines[line]
 
     def output_char(self, char: str, refresh: bool = True):
         """Simulate a teletype for a single character."""
         # print("output_char", repr(char))
-        match char:
-            case "\n":
-                self.line += 1
-            case "\r":
-                self.column = 0
-            case "\t":
-                self.column = (self.column + 7) // 8 * 8
-            case "\b":
-                self.column -= 1
-            case "\f":
-                self.reinit()
-            case _:
-                if char >= " ":
-                    char = upper(char)
-                    self.alloc_line(self.line).place_char(self.column, char)
-                    self.frontend.draw_char(self.line, self.column, char)
-                    self.column += 1
-        self.constrain_cursor()
+        control = self.controls.get(char)
+        if control is not None:
+            control()
+        elif char >= " ":
+            self.output_run(char)
         self.scroll_into_view()
         if refresh:
             self.refresh_screen()
 
+    def newline(self) -> None:
+        """Advance the paper one line."""
+        self.line += 1
+
+    def carriage_return(self) -> None:
+        """Return the carriage to the left margin."""
+        self.column = 0
+
+    def tab(self) -> None:
+        """Move to the next tab stop, stopping at the right margin."""
+        self.column = min((self.column + 7) // 8 * 8, COLUMNS - 1)
+
+    def backspace(self) -> None:
+        """Move back one column, stopping at the left margin."""
+        if self.column > 0:
+            self.column -= 1
+
     def lines_screen(self) -> int:
         """Return the number of lines on the screen (from front-end)."""
-        return self.frontend.lines_screen()
+        return self._lines_screen
+
+    def resize(self) -> None:
+        """Pick up a change in the front-end's number of lines."""
+        self._lines_screen = self.frontend.lines_screen()
 
     def refresh_screen(self) -> None:
         """Refresh the screen (to front-end)."""
         self.frontend.refresh_screen(self.scroll_base, self.line, self.column)
 
     def output_chars(self, chars: str, refresh: bool = True) -> None:
-        """Call output_char in a loop without refreshing."""
-        for char in chars:
-            self.output_char(char, False)
+        """Simulate a teletype for a string of characters.
+
+        Runs of printable characters go to the line and the frontend in one
+        piece; control characters are looked up in self.controls. The view
+        is only scrolled once, at the end.
+        """
+        controls = self.controls
+        pos = 0
+        for match in _PRINTABLE_RUN.finditer(chars):
+            for char in chars[pos : match.start()]:
+                control = controls.get(char)
+                if control is not None:
+                    control()
+            self.output_run(match.group())
+            pos = match.end()
+        for char in chars[pos:]:
+            control = controls.get(char)
+            if control is not None:
+                control()
+        self.scroll_into_view()
         if refresh:
             self.refresh_screen()
 
+    def output_run(self, run: str) -> None:
+        """Print a run of printable characters.
+
+        Doesn't refresh or scroll the view.
+        """
+        run = run.translate(_UPPER)
+        if not run.isascii():
+            run = "".join(upper(char) for char in run)
+        line = self.lines[self.line]
+        fits = run[: COLUMNS - self.column]
+        line.place_run(self.column, fits)
+        self.frontend.draw_run(self.line, self.column, fits)
+        self.column += len(fits)
+        self.constrain_cursor()
+        for char in run[len(fits) :]:
+            # Past the right margin everything piles up in the last column
+            line.place_char(self.column, char)
+            self.frontend.draw_run(self.line, self.column, char)
+
     def constrain_cursor(self) -> None:
         """Ensure cursor is not out of bounds."""
         if self.line < 0:
@@ -288,10 +492,13 @@ class Terminal:
         """Scroll line into view."""
         if line is None:
             line = self.line
+        lines_screen = self._lines_screen
+        if self.scroll_base <= line < self.scroll_base + lines_screen:
+            return
         if line < self.scroll_base:
             self.scroll_base = line
-        if line >= self.scroll_base + self.lines_screen():
-            self.scroll_base = line - self.lines_screen() + 1
+        if line >= self.scroll_base + lines_screen:
+            self.scroll_base = line - lines_screen + 1
 
     def page_down(self) -> None:
         """Scroll the page down."""
@@ -315,9 +522,33 @@ class Terminal:
             self.scroll_base = 0
 
 
+@functools.lru_cache(maxsize=1)
+def _tk_font_options() -> tuple[tuple[str, Any], ...]:
+    """Pick the font for the tkinter frontend.
+
+    Needs a Tk root to exist. Returns the font options as items, since
+    asking Tk for the installed families is slow.
+    """
+    families = tkinter.font.families()
+    if "Teleprinter" in families:
+        # http://www.zanzig.com/download/
+        font = tkinter.font.Font(family="Teleprinter").actual()
+        font["weight"] = "bold"
+    elif "TELETYPE 1945-1985" in families:
+        # https://www.dafont.com/teletype-1945-1985.font
+        font = tkinter.font.Font(family="TELETYPE 1945-1985").actual()
+    else:
+        font = tkinter.font.nametofont("TkFixedFont").actual()
+    font["size"] = 16
+    return tuple(font.items())
+
+
 class TkinterFrontend(Frontend):
     """Front-end using tkinter."""
 
+    # How often the Tk loop picks up output from the backend
+    POLL_MILLIS = 10
+
     # pylint: disable=too-many-instance-attributes
     def __init__(self, terminal: Terminal | None = None) -> None:
         """terminal: the Terminal using this frontend."""
@@ -325,17 +556,7 @@ class TkinterFrontend(Frontend):
         bg = "#%02x%02x%02x" % background_color()
         self.terminal = terminal
         self.root = tkinter.Tk()
-        if "Teleprinter" in tkinter.font.families(self.root):
-            # http://www.zanzig.com/download/
-            font = tkinter.font.Font(family="Teleprinter").actual()
-            font["weight"] = "bold"
-        elif "TELETYPE 1945-1985" in tkinter.font.families(self.root):
-            # https://www.dafont.com/teletype-1945-1985.font
-            font = tkinter.font.Font(family="TELETYPE 1945-1985").actual()
-        else:
-            font = tkinter.font.nametofont("TkFixedFont").actual()
-        font["size"] = 16
-        font = tkinter.font.Font(**font)
+        font = tkinter.font.Font(**dict(_tk_font_options()))
         self.font = font
         self.font_width = font.measure("X")
         self.font_height = self.font_width * 10 / 6
@@ -356,6 +577,10 @@ class TkinterFrontend(Frontend):
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
         self.max_line = 0
+        # Text items by (line, column they end at), for adding on to them
+        self.text_ends: dict[tuple[int, int], tuple[int, str]] = {}
+        # Output from the backend thread, waiting for the Tk loop
+        self._posted: deque[str] = deque()
         self.canvas.config(
             xscrollcommand=xscrollbar.set,
             yscrollcommand=yscrollbar.set,
@@ -388,23 +613,49 @@ class TkinterFrontend(Frontend):
                 self.terminal.backend.write_char(event.char)
 
     def postchars(self, chars: str):
-        """Relay the characters from the backend to the controller."""
+        """Queue characters from the backend for the Tk loop.
+
+        Tk may only be used from its own thread, so this doesn't draw.
+        """
+        self._posted.append(chars)
+
+    def poll_posted(self) -> None:
+        """Print everything posted since the last poll, and poll again."""
         assert self.terminal is not None
-        self.terminal.output_chars(chars)
+        posted = self._posted
+        if posted:
+            self.terminal.output_chars(
+                "".join([posted.popleft() for _ in range(len(posted))])
+            )
+        self.root.after(self.POLL_MILLIS, self.poll_posted)
 
     def draw_char(self, line: int, column: int, char: str):
         """Draw a character on the screen."""
-        x = column * self.font_width
-        y = line * self.font_height
-        # print("drawing char", repr(char), "at", (x, y))
-        self.canvas.create_text(
-            (x, y), text=char, fill=self.fg, anchor="nw", font=self.font
-        )
-        # Yes, this creates an object for every character.  Yes, it is
-        # disgusting, and gets hideously slow after a few thousand lines of
-        # output.  The Tkinter front end is mainly intended for testing.
+        self.draw_run(line, column, char)
+
+    def draw_run(self, line: int, column: int, run: str):
+        """Draw a run of characters on the screen."""
+        key = (line, column)
+        if key in self.text_ends:
+            # Carry on from where some earlier text left off
+            text_id, text = self.text_ends.pop(key)
+            text = text + run
+            self.canvas.itemconfigure(text_id, text=text)
+        else:
+            x = column * self.font_width
+            y = line * self.font_height
+            text = run
+            text_id = self.canvas.create_text(
+                (x, y), text=text, fill=self.fg, anchor="nw", font=self.font
+            )
+        self.text_ends[(line, column + len(run))] = (text_id, text)
+        # This still creates an object for every overstrike, and for every
+        # stretch of text the carriage jumps into.  The Tkinter front end is
+        # mainly intended for testing.
         if self.max_line < line:
             self.max_line = line
+            if self.terminal is not None:
+                self.terminal.resize()
 
     def lines_screen(self):
         """Return the number of lines per screen.
@@ -426,6 +677,8 @@ class TkinterFrontend(Frontend):
         self.canvas.coords(self.cursor_id, (x0, y0, x1, y1))
         if self.max_line < cursor_line:
             self.max_line = cursor_line
+            if self.terminal is not None:
+                self.terminal.resize()
         scr_height = (self.max_line + 1) * self.font_height
         self.canvas.config(
             scrollregion=(
@@ -449,13 +702,16 @@ class TkinterFrontend(Frontend):
     def reinit(self):
         """Clear everything."""
         self.canvas.delete("all")
+        self.text_ends.clear()
         bbox = (0, 0, self.font_width, self.font_height)
         self.cursor_id = self.canvas.create_rectangle(bbox)
 
     def mainloop(self, terminal: Terminal):
         """Set the frontend's terminal and run the main loop."""
         self.terminal = terminal
+        self.root.after(self.POLL_MILLIS, self.poll_posted)
         self.root.mainloop()
+        terminal.backend.alive = False
 
 
 class PygameFrontend(Frontend):
@@ -474,6 +730,10 @@ class PygameFrontend(Frontend):
         pygame.init()
         self.font: pygame.font.Font = self._findfont(22)
         self.font_width, self.font_height = self.font.size("X")
+        # Every printable ASCII character, rendered once
+        self.glyphs: dict[str, pygame.Surface] = {
+            chr(c): self.font.render(chr(c), True, TEXT_COLOR) for c in range(32, 127)
+        }
         self.width_pixels: int = COLUMNS * self.font_width
         if target_surface is None:
             pygame.display.set_caption("Terminal")
@@ -486,6 +746,11 @@ class PygameFrontend(Frontend):
         self.lines_per_page: int = lines_per_page
         self.char_event_num: int = pygame.USEREVENT + 1
         self.terminal: Terminal | None = None
+        # Pages drawn on since the last refresh
+        self._dirty_pages: set[int] = set()
+        # What the screen showed at the last refresh (None: redraw it all)
+        self._last_scroll: int | None = None
+        self._last_cursor: tuple[int, int] | None = None
 
     def _findfont(self, fontsize: int) -> pygame.font.Font:
         # pygame SysFont doesn't help on Windows, so look for specific files in known locations
@@ -515,6 +780,8 @@ class PygameFrontend(Frontend):
     def reinit(self, lines_per_page: int | None = None):
         """Clear and reset all terminal state."""
         self.page_surfaces.clear()
+        self._dirty_pages.clear()
+        self._last_scroll = None
         if lines_per_page:
             self.lines_per_page = lines_per_page
 
@@ -537,54 +804,115 @@ class PygameFrontend(Frontend):
                 (self.width_pixels, self.lines_per_page * self.font_height)
             )
             page_surface.fill(background_color())
+            self._dirty_pages.add(len(self.page_surfaces))
             self.page_surfaces.append(page_surface)
         return self.page_surfaces[i]
 
-    def blit_page_to_screen(self, page_number: int, scroll_base: int) -> None:
-        """Refresh a single page surface to the screen."""
+    def blit_page_to_screen(
+        self, page_number: int, scroll_base: int
+    ) -> pygame.Rect | None:
+        """Refresh a single page surface to the screen.
+
+        Returns the area of the screen changed, if any.
+        """
         line0 = page_number * self.lines_per_page
         line1 = (page_number + 1) * self.lines_per_page
         if line1 < scroll_base:
-            return  # page is off top of screen
+            return None  # page is off top of screen
         if line0 > scroll_base + self.lines_screen():
-            return  # page is off bottom of screen
+            return None  # page is off bottom of screen
         dest = (0, self.font_height * (line0 - scroll_base))
         area = pygame.Rect(
             0, 0, self.width_pixels, self.lines_per_page * self.font_height
         )
         page_surface = self.page_surfaces[page_number]
         # print("blit page", page_number, dest, area)
-        self.target_surface.blit(page_surface, dest, area)
+        return self.target_surface.blit(page_surface, dest, area)
 
-    def draw_cursor(self, phys_line: int, column: int) -> None:
-        """Draw the cursor."""
-        curs = pygame.Rect(
+    def visible_pages(self, scroll_base: int) -> range:
+        """Return the numbers of the pages that are on the screen."""
+        first = max(0, scroll_base // self.lines_per_page)
+        last = (scroll_base + self.lines_screen()) // self.lines_per_page
+        return range(first, min(last + 1, len(self.page_surfaces)))
+
+    def cursor_rect(self, phys_line: int, column: int) -> pygame.Rect:
+        """Return the screen area of the cursor."""
+        return pygame.Rect(
             self.font_width * column,
             self.font_height * phys_line,
             self.font_width,
             self.font_height,
         )
+
+    def draw_cursor(self, phys_line: int, column: int) -> pygame.Rect:
+        """Draw the cursor."""
+        curs = self.cursor_rect(phys_line, column)
         pygame.draw.rect(self.target_surface, TEXT_COLOR, curs, 1)
+        return curs
 
     def refresh_screen(
         self, scroll_base: int, cursor_line: int, cursor_column: int
     ) -> None:
-        """Refresh the screen."""
-        cursor_phys_line = cursor_line - scroll_base
-        for i in range(len(self.page_surfaces)):
-            self.blit_page_to_screen(i, scroll_base)
-        self.draw_cursor(cursor_phys_line, cursor_column)
-        pygame.display.update()
+        """Refresh the screen.
+
+        Only pages drawn on since the last refresh get copied to the screen,
+        unless it has scrolled.
+        """
+        cursor = (cursor_line - scroll_base, cursor_column)
+        full = scroll_base != self._last_scroll
+        if full:
+            # Everything has moved
+            self.target_surface.fill(background_color())
+            self._dirty_pages.update(self.visible_pages(scroll_base))
+        elif not self._dirty_pages and cursor == self._last_cursor:
+            return
+        rects: list[pygame.Rect] = []
+        if not full and self._last_cursor is not None and cursor != self._last_cursor:
+            # Rub out the old cursor, and repaint whatever was under it
+            old = self.cursor_rect(*self._last_cursor)
+            self.target_surface.fill(background_color(), old)
+            rects.append(old)
+            page_number = (self._last_cursor[0] + scroll_base) // self.lines_per_page
+            if page_number < len(self.page_surfaces):
+                self._dirty_pages.add(page_number)
+        for i in sorted(self._dirty_pages):
+            rect = self.blit_page_to_screen(i, scroll_base)
+            if rect is not None:
+                rects.append(rect)
+        rects.append(self.draw_cursor(*cursor))
+        if full:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+        self._dirty_pages.clear()
+        self._last_scroll = scroll_base
+        self._last_cursor = cursor
         sys.stdout.flush()
 
     def draw_char(self, line: int, column: int, char: str) -> None:
         """Draw a character on the page backing."""
-        text = self.font.render(char, True, TEXT_COLOR)
+        text = self.glyphs.get(char)
+        if text is None:
+            text = self.font.render(char, True, TEXT_COLOR)
+        page_number, page_line = divmod(line, self.lines_per_page)
+        page_surface = self.alloc_page(page_number)
+        page_surface.blit(
+            text, (self.font_width * column, self.font_height * page_line)
+        )
+        self._dirty_pages.add(page_number)
+
+    def draw_run(self, line: int, column: int, run: str) -> None:
+        """Draw a run of characters on the page backing."""
+        if len(run) == 1:
+            self.draw_char(line, column, run)
+            return
+        text = self.font.render(run, True, TEXT_COLOR)
         page_number, page_line = divmod(line, self.lines_per_page)
         page_surface = self.alloc_page(page_number)
         page_surface.blit(
             text, (self.font_width * column, self.font_height * page_line)
         )
+        self._dirty_pages.add(page_number)
 
     def postchars(self, chars: str) -> None:
         """Post message with characters to render."""
@@ -616,13 +944,22 @@ class PygameFrontend(Frontend):
         """Run game loop."""
         self.terminal = terminal
         self.sounds.start()
+        quitting = False
         while True:
+            if quitting and not self.sounds.stopping:
+                pygame.mixer.quit()
+                pygame.quit()
+                sys.exit()
+            # Output from the backend, all printed together after the loop
+            chars: list[str] = []
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    # Let the power-off sound play out before quitting
                     self.sounds.stop()
-                    pygame.mixer.quit()
-                    pygame.quit()
-                    sys.exit()
+                    self.terminal.backend.alive = False
+                    quitting = True
+                if quitting and event.type not in self.sounds.EVENTS:
+                    continue
                 if event.type == pygame.KEYDOWN:
                     self.handle_key(event)
                 if event.type == pygame.KEYUP:
@@ -636,14 +973,19 @@ class PygameFrontend(Frontend):
                         (self.width_pixels, height), pygame.RESIZABLE
                     )
                     self.target_surface.fill(background_color())
+                    self._last_scroll = None
+                    self.terminal.resize()
                     self.terminal.scroll_into_view()
                     self.terminal.refresh_screen()
                 if event.type == self.char_event_num:
-                    self.terminal.output_chars(event.chars)
-                    self.sounds.print_chars(event.chars)
+                    chars.append(event.chars)
                 if event.type in self.sounds.EVENTS:
                     # Sound events notify that playback is ended on a sound or channel
                     self.sounds.event(event.type)
+            if chars and not quitting:
+                text = "".join(chars)
+                self.terminal.output_chars(text)
+                self.sounds.print_chars(text)
 
 
 # pylint: disable=unused-argument,no-self-use
@@ -665,7 +1007,10 @@ class DummyFrontend(Frontend):
         The Dummy frontend ignores the position and just outputs.
         """
         sys.stdout.write(char)
-        sys.stdout.flush()
+
+    def draw_run(self, line: int, column: int, run: str) -> None:
+        """Draw a run of characters, ignoring the position like draw_char."""
+        sys.stdout.write(run)
 
     def lines_screen(self) -> int:
         """Return the number of lines per screen."""
@@ -676,9 +1021,9 @@ class DummyFrontend(Frontend):
     ) -> None:
         """Refersh the terminal screen.
 
-        Does nothing for the Dummy frontend.
+        Just flushes whatever has been drawn since the last refresh.
         """
-        pass
+        sys.stdout.flush()
 
     def reinit(self) -> None:
         """Reset the frontend.
@@ -744,6 +1089,7 @@ class ParamikoBackend(Backend):
         self.port: int = port
         self.username: str = username
         self.keyfile: str = keyfile
+        self._pacer = Pacer(self)
 
     def write_char(self, char: str) -> None:
         """Send a keyboard character to the host."""
@@ -760,22 +1106,26 @@ class ParamikoBackend(Backend):
         self.channel = ssh.open_session()
         self.channel.get_pty(term="tty33")
         self.channel.invoke_shell()
+        self._pacer.start()
+        recv = self.channel.recv
+        room = self._pacer.room
+        put = self._pacer.put
         while True:
-            if self.fast_mode:
-                data = self.channel.recv(1024)
-                if not data:
-                    break
-                self.postchars(data.decode("ascii", "replace"))
-            else:
-                byte = self.channel.recv(1)
-                if not byte:
-                    break
-                self.postchars(byte.decode("ascii", "replace"))
-                time.sleep(0.105)
+            data = recv(min(room(), 1024))
+            if not data:
+                break
+            put(data.decode("ascii", "replace"))
         self.channel = None
+        self._pacer.close()
         self.postchars("Disconnected. Local mode.\r\n")
 
 
+# Telnet subnegotiations: window size, terminal speed and terminal type
+_NAWS_MSG = IAC + SB + NAWS + bytes([0, COLUMNS, 0, 24]) + IAC + SE
+_TSPEED_MSG = IAC + SB + TSPEED + BINARY + b"110,110" + IAC + SE
+_TTYPE_MSG = IAC + SB + TTYPE + BINARY + b"tty33" + IAC + SE
+
+
 class TelnetBackend(Backend):
     """Connects a remote host to the terminal."""
 
@@ -797,6 +1147,7 @@ class TelnetBackend(Backend):
         self.host = host
         self.port = port
         self.will_naws: int = 0
+        self._pacer = Pacer(self)
 
     def write_char(self, char: str):
         """Send a keyboard character to the host."""
@@ -814,9 +1165,9 @@ class TelnetBackend(Backend):
                 sbdata = self.conn.read_sb_data()
                 logger.info("SE: %s", sbdata)
                 if sbdata == TSPEED + ECHO:
-                    sock.sendall(IAC + SB + TSPEED + BINARY + b"110,110" + IAC + SE)
+                    sock.sendall(_TSPEED_MSG)
                 elif sbdata == TTYPE + ECHO:
-                    sock.sendall(IAC + SB + TTYPE + BINARY + b"tty33" + IAC + SE)
+                    sock.sendall(_TTYPE_MSG)
             if cmd in (DO, DONT):
                 if opt in [TTYPE, TSPEED, NAWS]:
                     logger.info("IAC WILL %s", ord(opt))
@@ -834,30 +1185,26 @@ class TelnetBackend(Backend):
                     logger.debug("IAC DONT %s", ord(opt))
                     sock.sendall(IAC + DONT + opt)
 
+        self._pacer.start()
         with Telnet(host=self.host, port=self.port) as self.conn:
             self.conn.set_option_negotiation_callback(telnet_callback)
+            read_eager = self.conn.read_eager
+            put = self._pacer.put
             while True:
                 try:
-                    data = self.conn.read_eager()
+                    data = read_eager()
                 except (EOFError, ConnectionResetError):
                     break
                 time_now = int(time.time())
                 if self.will_naws and time_now > self.will_naws + 30:
                     self.will_naws = time_now
-                    self.conn.sock.sendall(
-                        IAC + SB + NAWS + bytes([0, 72, 0, 24]) + IAC + SE
-                    )
+                    self.conn.sock.sendall(_NAWS_MSG)
                 if not data:
                     continue
                 logger.info("%d bytes", len(data))
-                for datum in data:
-                    try:
-                        self.postchars(bytes([datum]).decode("ascii", "replace"))
-                    except pygame.error:
-                        logger.error("ERR '%c'", datum)
-                    if not self.fast_mode:
-                        time.sleep(0.105)
+                put(data.decode("ascii", "replace"))
         self.conn = None
+        self._pacer.close()
         self.postchars("Disconnected. Local mode.\r\n")
 
 
@@ -882,42 +1229,75 @@ class TelnetLib3Backend(Backend):
         self._host = host
         self._port = port
         self._lines_per_screen = lines_per_screen
-        self._reader: telnetlib3.TelnetUnicodeReader | None = None
-        self._writer: telnetlib3.TelnetUnicodeWriter | None = None
+        self._reader: telnetlib3.TelnetReader | None = None
+        self._writer: telnetlib3.TelnetWriter | None = None
 
     def write_char(self, char: str) -> None:
-        """Write a character from the keyboard to the backend."""
-        if self._writer is not None:
-            self._writer.write(char)
-        else:
-            self.postchars(char)
+        """Write a character from the keyboard to the backend.
+
+        Not connected, so just echo it; run() swaps in _write_to_host.
+        """
+        self.postchars(char)
+
+    def _write_to_host(self, char: str) -> None:
+        """Write a character from the keyboard to the connected host."""
+        assert self._writer is not None
+        self._writer.write(char.encode("ascii", "replace"))
 
     async def reader(self) -> None:
         """Read input from the telnet and send it to the frontend in a loop."""
-        while self._reader is not None:
-            data = await self._reader.read(1)
-            try:
-                self.postchars(data)
-            except pygame.error:
-                logger.error(f"ERR {data}")
-            if not self.fast_mode:
-                await asyncio.sleep(0.105)
+        loop = asyncio.get_running_loop()
+        # When the next character is due in slow mode; keeping a schedule
+        # rather than sleeping after each character stops the pace drifting
+        due = loop.time()
+        assert self._reader is not None
+        read = self._reader.read
+        postchars = self.postchars
+        while True:
+            raw = await read(4096)
+            if not raw:
+                break
+            data = raw.decode("ascii", "replace")
+            for i, char in enumerate(data):
+                if not self.alive:
+                    return
+                if self.fast_mode:
+                    postchars(data[i:])
+                    break
+                now = loop.time()
+                if due > now:
+                    await asyncio.sleep(due - now)
+                postchars(char)
+                due = max(now, due) + 0.105
+        del self.write_char
+        self._reader = self._writer = None
+        self.postchars("Disconnected. Local mode.\r\n")
+
+    async def run(self) -> None:
+        """Connect, then read until disconnected."""
+        self._reader, self._writer = await telnetlib3.open_connection(
+            self._host,
+            self._port,
+            # Bytes in, so each chunk is decoded in one go
+            encoding=False,
+            term="tty33",
+            cols=COLUMNS,
+            rows=self._lines_per_screen,
+            tspeed=(110, 110),
+        )
+        self.write_char = self._write_to_host  # pylint: disable=method-hidden
+        await self.reader()
 
     def thread_target(self) -> None:
         """Set everything up."""
-        runner = asyncio.Runner()
-        self._reader, self._writer = runner.run(
-            telnetlib3.open_connection(
-                self._host,
-                self._port,
-                encoding="ascii",
-                term="tty33",
-                cols=COLUMNS,
-                rows=self._lines_per_screen,
-                tspeed=(110, 110),
-            )
-        )
-        runner.run(self.reader())
+        asyncio.run(self.run())
+
+
+# Encoded keys, for writing to a file descriptor without encoding each time
+_KEY_BYTES = {chr(code): bytes([code]) for code in range(128)}
+_CRMOD_KEY_BYTES = {**_KEY_BYTES, "\r": b"\n"}
+# What crmod echoes for the keys it sends as newlines
+_CRMOD_ECHO = str.maketrans({"\r": "\r\n", "\n": "\r\n"})
 
 
 class FiledescBackend(Backend, abc.ABC):
@@ -941,18 +1321,36 @@ class FiledescBackend(Backend, abc.ABC):
         self.read_fd: int | None = None
         self.crmod = crmod
         self.lecho = lecho
+        self._pacer = Pacer(self)
 
     def write_char(self, char: str) -> None:
-        """Place a character into the output."""
-        if self.write_fd is not None:
-            if self.crmod:
-                char = char.replace("\r", "\n")
-            os.write(self.write_fd, char.encode())
+        """Place a character into the output.
+
+        Nothing is open, so just echo it; __enter__ swaps in _write_to_fd.
+        """
+        self.postchars(char)
+
+    def _write_to_fd(self, char: str) -> None:
+        """Write a character to the open file."""
+        assert self.write_fd is not None
+        if self.crmod and char == "\r":
+            # Return is the usual crmod key, and needs no lookups at all
+            os.write(self.write_fd, b"\n")
             if self.lecho:
-                if self.crmod:
-                    char = char.replace("\n", "\r\n")
-                self.postchars(char)
+                self.postchars("\r\n")
+            return
+        if self.crmod:
+            data = _CRMOD_KEY_BYTES.get(char)
+            if data is None:
+                data = char.replace("\r", "\n").encode()
         else:
+            data = _KEY_BYTES.get(char)
+            if data is None:
+                data = char.encode()
+        os.write(self.write_fd, data)
+        if self.lecho:
+            if self.crmod:
+                char = char.translate(_CRMOD_ECHO)
             self.postchars(char)
 
     @abc.abstractmethod
@@ -971,37 +1369,37 @@ class FiledescBackend(Backend, abc.ABC):
     def __enter__(self) -> Self:
         """Run the setup, automatically teardown when finished."""
         self.setup()
+        self.write_char = self._write_to_fd  # pylint: disable=method-hidden
         return self
 
     # pylint:disable=unused-argument
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         """Teardown when finished."""
+        del self.write_char
         self.teardown()
 
     def thread_target(self):
         """Start up the thread."""
+        self._pacer.start()
         with self:
+            read_fd = self.read_fd
+            assert read_fd is not None
+            crmod = self.crmod
+            room = self._pacer.room
+            put = self._pacer.put
             while True:
-                if self.fast_mode:
-                    assert self.read_fd is not None
-                    data = os.read(self.read_fd, 1024)
-                    if not data:
-                        break
-                    if self.crmod:
-                        data = data.replace(b"\n", b"\r\n")
-                    self.postchars(data.decode("ascii", "replace"))
-                else:
-                    try:
-                        assert self.read_fd is not None
-                        byte = os.read(self.read_fd, 1)
-                    except OSError:
-                        break
-                    if not byte:
-                        break
-                    if self.crmod:
-                        byte = byte.replace(b"\n", b"\r\n")
-                    self.postchars(byte.decode("ascii", "replace"))
-                    time.sleep(0.105)
+                try:
+                    # Leave what the pacer has no room for with the child,
+                    # so it blocks and an interrupt can still flush it
+                    data = os.read(read_fd, min(room(), 4096))
+                except OSError:
+                    break
+                if not data:
+                    break
+                if crmod and b"\n" in data:
+                    data = data.replace(b"\n", b"\r\n")
+                put(data.decode("ascii", "replace"))
+        self._pacer.close()
         self.postchars("Disconnected. Local mode.\r\n")
 
 
@@ -1024,23 +1422,33 @@ class PipeBackend(FiledescBackend):
 
     def setup(self):
         """Start the process and hooks up the file descriptors."""
-        self.proc = subprocess.Popen(
-            self.cmd,
-            shell=self.shell,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        assert self.proc.stdin is not None
-        assert self.proc.stdout is not None
-        self.write_fd = self.proc.stdin.fileno()
-        self.read_fd = self.proc.stdout.fileno()
+        # Plain pipes, so nothing buffers between os.read/os.write and the child
+        child_stdin, self.write_fd = os.pipe()
+        self.read_fd, child_stdout = os.pipe()
+        try:
+            self.proc = subprocess.Popen(
+                self.cmd,
+                shell=self.shell,
+                stdin=child_stdin,
+                stdout=child_stdout,
+                stderr=child_stdout,
+            )
+        except OSError:
+            super().teardown()
+            raise
+        finally:
+            os.close(child_stdin)
+            os.close(child_stdout)
 
     def teardown(self):
-        """Close the file descriptors."""
-        # Is there a good way to close this other than let gc take care of it?
-        self.proc = None
-        self.read_fd = self.write_fd = None
+        """Close the file descriptors and reap the process."""
+        super().teardown()
+        if self.proc is not None:
+            try:
+                self.proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                logger.warning("%r is still running", self.cmd)
+            self.proc = None
 
 
 class PtyBackend(FiledescBackend):
@@ -1069,26 +1477,36 @@ class PtyBackend(FiledescBackend):
     def setup(self):
         """Start the process and hooks up the file descriptors."""
         assert gotpty
-        pid, master = pty.fork()
-        if pid:
-            self.write_fd = self.read_fd = master
-        else:
-            try:
-                attr = termios.tcgetattr(0)
-                attr[3] &= ~(termios.ECHOE | termios.ECHOKE)
-                attr[3] |= termios.ECHOPRT | termios.ECHOK
-                attr[4] = termios.B110
-                attr[5] = termios.B110
-                attr[6][termios.VERASE] = b"#"
-                attr[6][termios.VKILL] = b"@"
-                termios.tcsetattr(0, termios.TCSANOW, attr)
-                os.environ["TERM"] = "tty33"
-                os.execvp(self.args[0], self.args)
-            except Exception as ex:
-                os.write(2, str(ex).encode("ascii", "replace"))
-                os.write(2, b"\r\n")
-                os._exit(126)
-            os._exit(126)
+        master, slave = pty.openpty()
+        try:
+            attr = termios.tcgetattr(slave)
+            attr[3] &= ~(termios.ECHOE | termios.ECHOKE)
+            attr[3] |= termios.ECHOPRT | termios.ECHOK
+            attr[4] = termios.B110
+            attr[5] = termios.B110
+            attr[6][termios.VERASE] = b"#"
+            attr[6][termios.VKILL] = b"@"
+            termios.tcsetattr(slave, termios.TCSANOW, attr)
+            # Opening the slave in the new session makes it the child's
+            # controlling terminal; our own descriptors are close-on-exec.
+            os.posix_spawnp(
+                self.args[0],
+                self.args,
+                {**os.environ, "TERM": "tty33"},
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 0, os.ttyname(slave), os.O_RDWR, 0),
+                    (os.POSIX_SPAWN_DUP2, 0, 1),
+                    (os.POSIX_SPAWN_DUP2, 0, 2),
+                ],
+                setsid=True,
+            )
+        except Exception as ex:
+            # Print the failure on the terminal, as the child would have
+            os.write(slave, str(ex).encode("ascii", "replace"))
+            os.write(slave, b"\r\n")
+        finally:
+            os.close(slave)
+        self.write_fd = self.read_fd = master
 
     def teardown(self):
         """Close the file descriptor."""